@@ -1,3 +1,6 @@
-from django_test_model_builder.builders import ModelBuilder
+from django_test_model_builder.builders import (
+    CannotSetFieldOnModelException,
+    ModelBuilder,
+)
 
-__all__ = ['ModelBuilder']
+__all__ = ['CannotSetFieldOnModelException', 'ModelBuilder']
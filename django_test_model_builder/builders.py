@@ -1,62 +1,341 @@
 import copy
+import pickle
+from datetime import date, datetime
+from decimal import Decimal
+from functools import wraps
 
-from django.db import models
+# Exact value types that can never be callable, checked before falling
+# back to callable() when resolving field values in build().
+_NON_CALLABLE_FAST_TYPES = frozenset({
+    str, int, float, bool, bytes, type(None), date, datetime, Decimal,
+})
+
+_UNSET = object()
+
+
+def _compile_field_resolver(template, model_attributes, field_aliases):
+    """
+    Generate a field resolver specialized to one builder class. The
+    default field names and which of their values are callable are fixed
+    once the defaults template is cached, so the generic
+    merge/filter/resolve loops can be unrolled into straight-line code:
+    one block per default field, plus a loop over whatever extra
+    overrides sit in data. Compiled once per class and cached.
+    """
+    lines = [
+        'def resolver(self):',
+        '    data = self.data',
+        '    model_fields = {}',
+    ]
+    namespace = {
+        '_UNSET': _UNSET,
+        '_FAST_TYPES': _NON_CALLABLE_FAST_TYPES,
+        '_KNOWN': frozenset(template),
+        '_ATTRIBUTES': model_attributes,
+        '_ALIASES': field_aliases,
+    }
+    for i, (key, default) in enumerate(template.items()):
+        name = '_default_{}'.format(i)
+        namespace[name] = default
+        resolved = '{}()'.format(name) if callable(default) else name
+        if key in model_attributes:
+            alias = field_aliases.get(key)
+            lines.append('    v = data.get({!r}, _UNSET)'.format(key))
+            if alias is None:
+                lines += [
+                    '    if v is _UNSET:',
+                    '        model_fields[{!r}] = {}'.format(key, resolved),
+                ]
+            else:
+                # An override under the other spelling of this foreign
+                # key displaces the default, which must then not be
+                # resolved at all.
+                lines += [
+                    '    if v is _UNSET:',
+                    '        if {!r} not in data:'.format(alias),
+                    '            model_fields[{!r}] = {}'.format(
+                        key, resolved
+                    ),
+                ]
+            lines += [
+                '    elif v.__class__ not in _FAST_TYPES and callable(v):',
+                '        model_fields[{!r}] = v()'.format(key),
+                '    else:',
+                '        model_fields[{!r}] = v'.format(key),
+            ]
+        else:
+            # Non-field defaults cannot be overridden through data; they
+            # are passed through for pre() to consume.
+            lines.append('    model_fields[{!r}] = {}'.format(key, resolved))
+    lines += [
+        '    for k, v in data.items():',
+        '        if k in _KNOWN or k not in _ATTRIBUTES:',
+        '            continue',
+        '        if v.__class__ not in _FAST_TYPES and callable(v):',
+        '            v = v()',
+        '        model_fields[k] = v',
+        '        alias = _ALIASES.get(k)',
+        '        if alias is not None:',
+        '            model_fields.pop(alias, None)',
+        '    return model_fields',
+    ]
+    exec(
+        compile('\n'.join(lines), '<builder field resolver>', 'exec'),
+        namespace,
+    )
+    return namespace['resolver']
+
+# Field info per model class. A model's _meta.fields never change for the
+# lifetime of the process, so they are resolved once and shared by every
+# builder bound to the same model. Each entry is a (names, aliases) pair:
+# names is a frozenset of every field name and attname ('user' and
+# 'user_id'), aliases maps each spelling of a foreign key to the other so
+# an override under one spelling can displace a default under the other.
+_ATTNAME_CACHE = {}
+
+
+def _model_field_info(model):
+    info = _ATTNAME_CACHE.get(model)
+    if info is None:
+        names = set()
+        aliases = {}
+        for field in model._meta.fields:
+            names.add(field.name)
+            if field.attname != field.name:
+                names.add(field.attname)
+                aliases[field.name] = field.attname
+                aliases[field.attname] = field.name
+        info = _ATTNAME_CACHE.setdefault(model, (frozenset(names), aliases))
+    return info
+
+
+class CannotSetFieldOnModelException(Exception):
+    """
+    Raised when a dynamically generated setter targets a field that does
+    not exist on the builder's model.
+    """
+
+
+def _make_dynamic_setter(name, field_name):
+    """
+    Create the setter generated for a dynamic
+    dynamic_field_setter_prefix<fieldname> attribute.
+    """
+    def setter(self, value):
+        self._detach_data()
+        self.data[field_name] = value
+        return self
+
+    setter.__name__ = name
+    return setter
+
+
+def _chained_setter(method):
+    """
+    Wrap an explicitly defined setter so calling it chains like the
+    dynamically generated ones.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._detach_data()
+        method(self, *args, **kwargs)
+        return self
+
+    wrapper._is_chained_setter = True
+    return wrapper
 
 
 class ModelBuilder:
+    # Chains can allocate many builders; slots drop the per-instance
+    # __dict__ and make slot attribute reads a fixed-offset load.
+    # Subclasses that add their own instance attributes still work, they
+    # simply regrow a __dict__ unless they declare __slots__ too.
+    __slots__ = (
+        'data',
+        '_data_shared',
+        'instance',
+        'model_fields',
+        '_builder_context_cache',
+    )
+
     dynamic_field_setter_prefix = 'with_'
 
+    # Compile a field resolver specialized to this class's cached
+    # defaults template at first build. Disabled automatically when
+    # defaults_cacheable is False and safe to switch off wholesale if a
+    # builder does something the generated code cannot honour.
+    specialize_build = True
+
+    # How _copy() forks the builder: 'shallow' (copy-on-write, default),
+    # 'pickle' or 'deepcopy'. See _copy for the trade-offs.
+    clone_strategy = 'shallow'
+
+    # Length of the prefix, recomputed by __init_subclass__ when a
+    # subclass overrides dynamic_field_setter_prefix, so __getattr__
+    # never re-measures the string.
+    _prefix_len = len(dynamic_field_setter_prefix)
+
+    # Generated setters, memoized per class by __getattr__ so repeated
+    # calls reuse one function instead of rebuilding a closure each time.
+    _dynamic_setters = {}
+
+    # Reuse one get_default_fields() result per class instead of
+    # rebuilding the dict on every build(). Callables in the defaults are
+    # still invoked per build, only the dict itself is shared. Set to
+    # False on builders whose defaults depend on per-instance state.
+    defaults_cacheable = True
+
     def __init__(self):
         self.data = {}
+        self._data_shared = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Wrap any explicitly defined prefixed setters once at class
+        definition time so they chain like the dynamic ones, rather than
+        intercepting every attribute access at runtime.
+        """
+        super().__init_subclass__(**kwargs)
+
+        prefix = cls.dynamic_field_setter_prefix
+        for name, attribute in list(cls.__dict__.items()):
+            if (
+                callable(attribute)
+                and name.startswith(prefix)
+                and not getattr(attribute, '_is_chained_setter', False)
+            ):
+                setattr(cls, name, _chained_setter(attribute))
 
-    def __getattribute__(self, name):
+        # Each class memoizes its own generated setters; sharing the
+        # parent's dict would mix prefixes between subclasses.
+        cls._dynamic_setters = {}
+        cls._prefix_len = len(prefix)
+
+    def __getattr__(self, name):
         """
-        Overridden handler to support field and custom field and method
-        resolution for models. Implement using a chained
+        Fallback handler to support custom field and method resolution for
+        models. Implement using a chained
         dynamic_field_setter_prefix<fieldname> to set a custom field
         on the subclassed model e.g:
 
         Class FooBuilder(ModelBuilder):
             <dynamic_field_setter_prefix>username(self, name):
                 self.data['name'] = name or 'Billy'
-        """
-
-        # Ignore defined setter attribute prefix.
-        if name == 'dynamic_field_setter_prefix':
-            return super().__getattribute__(name)
 
-        # Handle anything without prefix normally.
-        if not name.startswith(self.dynamic_field_setter_prefix):
-            return super().__getattribute__(name)
-
-        # If prefixed function already exists, wrap it in a copy to allow
-        # for side effect free chaining.
-        try:
-            attribute = super().__getattribute__(name)
+        Only called when normal attribute lookup fails, so undecorated
+        access (self.data, self.model, ...) pays no extra dispatch cost.
+        """
+        prefix = self.dynamic_field_setter_prefix
+        if name.startswith(prefix):
+            # Dynamically create a default setter that adds the value to
+            # the data and returns the builder for chaining, memoized per
+            # class so later calls are a plain dict lookup.
+            cls = type(self)
+            setter = cls._dynamic_setters.get(name)
+            if setter is None:
+                field_name = name[cls._prefix_len:]
+                # Generated setters can only target real model fields;
+                # anything else needs an explicit setter method. The
+                # field names come from the per-model cache, so the
+                # check is a frozenset lookup and only runs the first
+                # time a setter is generated for the class.
+                model = getattr(cls, 'model', None)
+                if (
+                    model is not None
+                    and field_name not in _model_field_info(model)[0]
+                ):
+                    raise CannotSetFieldOnModelException(
+                        "'{}' is not a field on {}.".format(
+                            field_name, model.__name__
+                        )
+                    )
+                setter = cls._dynamic_setters.setdefault(
+                    name, _make_dynamic_setter(name, field_name)
+                )
+            return setter.__get__(self, cls)
 
-            def f(*args, **kwargs):
-                attribute(*args, **kwargs)
-                return self._copy()
+        raise AttributeError(name)
 
-            return f
+    def _get_model_attributes(self):
+        return _model_field_info(self.model)[0]
 
-        # Otherwise dynamically create a default that adds the value to the
-        # data and returns a copy of the result.
-        except AttributeError:
-            if name.startswith(self.dynamic_field_setter_prefix):
-                def f(value):
-                    field_name = name[len(self.dynamic_field_setter_prefix):]
-                    self.data[field_name] = value
-                    return self._copy()
+    def __deepcopy__(self, memo):
+        if self.clone_strategy == 'deepcopy':
+            return self._deep_clone(memo)
+        return self._shallow_clone(memo)
 
-                return f
+    def _deep_clone(self, memo):
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        for klass in cls.__mro__:
+            for attr in getattr(klass, '__slots__', ()):
+                try:
+                    value = getattr(self, attr)
+                except AttributeError:
+                    continue
+                setattr(new, attr, copy.deepcopy(value, memo))
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            new.__dict__.update(copy.deepcopy(instance_dict, memo))
+        return new
 
-            raise AttributeError
+    def _shallow_clone(self, memo):
+        """
+        Fork the builder. Chaining only ever rebinds keys in the data
+        dictionary; the model class, default callables and any
+        already-built instances are treated as immutable references by
+        build(). The fork shares the data dict and marks both sides, so
+        the next write on either detaches with a single dict copy and the
+        other side keeps what it had.
+        """
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        for klass in cls.__mro__:
+            for attr in getattr(klass, '__slots__', ()):
+                # Forks recompute their builder context; the cache stays
+                # behind with the builder that resolved it.
+                if attr == '_builder_context_cache':
+                    continue
+                try:
+                    setattr(new, attr, getattr(self, attr))
+                except AttributeError:
+                    continue
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            new.__dict__.update(instance_dict)
+        self._data_shared = True
+        new._data_shared = True
+        return new
 
-    def _get_model_attributes(self):
-        return [f.name for f in self.model._meta.fields]
+    def _detach_data(self):
+        # Copy-on-write: take a private copy of the data dict before the
+        # first mutation after a copy.
+        if self._data_shared:
+            self.data = self.data.copy()
+            self._data_shared = False
 
     def _copy(self):
+        """
+        Return an independent fork of the builder for branching chains,
+        e.g. base = AuthorBuilder().with_age(3); old = base._copy().
+        Plain chains skip this entirely: setters mutate in place and hand
+        the same builder back.
+
+        How the fork is taken is controlled by the clone_strategy class
+        attribute. 'shallow' (the default) shares everything by reference
+        with copy-on-write data, and is right whenever chaining only
+        rebinds keys in data. Subclasses carrying mutable state the
+        shallow fork would wrongly share can opt into 'pickle' (a
+        pickle round trip, usually several times faster than deepcopy)
+        or 'deepcopy' (the most general, and slowest).
+        """
+        strategy = self.clone_strategy
+        if strategy == 'shallow':
+            return self._shallow_clone({})
+        if strategy == 'pickle':
+            return pickle.loads(pickle.dumps(self))
         return copy.deepcopy(self)
 
     def get_default_fields(self):
@@ -69,6 +348,22 @@ class ModelBuilder:
             'Defaults method must be defined to set required fields on model.'
         )
 
+    def _get_default_fields_template(self):
+        """
+        Lazily computed per-class cache of get_default_fields(). The first
+        build() on each class resolves the dict; later builds start from a
+        shallow copy of it.
+        """
+        cls = type(self)
+        if not cls.defaults_cacheable:
+            return self.get_default_fields()
+
+        template = cls.__dict__.get('_default_fields_template')
+        if template is None:
+            template = self.get_default_fields()
+            cls._default_fields_template = template
+        return template
+
     def get_builder_context(self):
         """
         Override here with any extra context that you want to pass to the
@@ -76,6 +371,17 @@ class ModelBuilder:
         """
         return {}
 
+    def _get_builder_context(self):
+        """
+        Per-instance cache of get_builder_context(), so repeated build()
+        calls on the same builder resolve the context once.
+        """
+        try:
+            return self._builder_context_cache
+        except AttributeError:
+            context = self._builder_context_cache = self.get_builder_context()
+            return context
+
     def get_model(self):
         if not hasattr(self, 'model'):
             raise NotImplementedError(
@@ -104,33 +410,77 @@ class ModelBuilder:
         Extendable by Subclassed ModelBuilder.
         """
 
-    def build(self, save_to_db=True):
+    def _resolve_model_fields(self):
         """
-        Combine model defaults with any overridden values defined by the
-        builder. save_to_db=False will render the model in memory for later
-        propagation to the database defined by the user.
+        Generic field resolution: combine defaults and custom field
+        setters generating a dictionary of fields that correspond to the
+        set model, then run any functions bound to defaults or returned
+        in the custom field setters. Overrides and callables are resolved
+        in a single in-place pass rather than rebuilding the dictionary
+        per step.
         """
-        # Combine defaults and custom field setters generating a
-        # dictionary of fields that correspond to the set model.
-        self.model_fields = self.get_default_fields()
-        self.model_fields.update({
-            k: v
-            for k, v in self.data.items()
-            if k in self._get_model_attributes()
-        })
+        model_attributes, field_aliases = _model_field_info(self.model)
+        model_fields = dict(self._get_default_fields_template())
+        for k, v in self.data.items():
+            if k in model_attributes:
+                model_fields[k] = v
+                # An override keyed on one spelling of a foreign key
+                # ('user' / 'user_id') displaces a default keyed on the
+                # other, so the model never receives both.
+                alias = field_aliases.get(k)
+                if alias is not None:
+                    model_fields.pop(alias, None)
+
+        for k, v in model_fields.items():
+            if v.__class__ in _NON_CALLABLE_FAST_TYPES:
+                continue
+            if callable(v):
+                model_fields[k] = v()
 
-        # Run any functions bound to defaults or returned
-        # in the custom field setters
-        self.model_fields = {
-            k: v() if callable(v) else v for k, v in self.model_fields.items()
-        }
+        return model_fields
+
+    def _get_specialized_resolver(self):
+        """
+        Compile a field resolver specialized to this class's default
+        field shape the first time it builds; see
+        _compile_field_resolver. Returns the compiled function, or None
+        when specialization is disabled or introspection failed, in which
+        case _resolve_model_fields is used as-is.
+        """
+        cls = type(self)
+        resolver = cls.__dict__.get('_specialized_resolver', _UNSET)
+        if resolver is _UNSET:
+            resolver = None
+            if cls.specialize_build and cls.defaults_cacheable:
+                try:
+                    resolver = _compile_field_resolver(
+                        self._get_default_fields_template(),
+                        *_model_field_info(self.model)
+                    )
+                except Exception:
+                    resolver = None
+            cls._specialized_resolver = resolver
+        return resolver
+
+    def _prepare_instance(self):
+        """
+        Run every build step up to, but not including, saving: resolve the
+        field dictionary, merge the builder context, run pre() and attach
+        the fields to an in memory model.
+        """
+        resolver = self._get_specialized_resolver()
+        if resolver is not None:
+            self.model_fields = resolver(self)
+        else:
+            self.model_fields = self._resolve_model_fields()
 
         # Update internal data dictionary with any extra fields
         # the tester has defined. Only set fields that haven't been redefined
         # in any custom methods.
+        self._detach_data()
         self.data.update({
             k:v
-            for k, v in self.get_builder_context().items()
+            for k, v in self._get_builder_context().items()
             if k not in self.data
         })
 
@@ -140,6 +490,14 @@ class ModelBuilder:
         # Attach fields to in memory model.
         self.instance = self.model(**self.model_fields)
 
+    def build(self, save_to_db=True):
+        """
+        Combine model defaults with any overridden values defined by the
+        builder. save_to_db=False will render the model in memory for later
+        propagation to the database defined by the user.
+        """
+        self._prepare_instance()
+
         if save_to_db:
             self.create()
 
@@ -147,3 +505,30 @@ class ModelBuilder:
         self.post()
 
         return self.instance
+
+    @classmethod
+    def bulk_build(cls, builders, batch_size=1000):
+        """
+        Build many instances through a single bulk_create instead of one
+        INSERT per builder. Each builder runs the same prepare/pre steps
+        as build() and its post() hook after creation; only the save
+        itself is batched. All builders must target the same model.
+        Returns the list of built instances.
+        """
+        builders = list(builders)
+        if not builders:
+            return []
+
+        for builder in builders:
+            builder._prepare_instance()
+
+        instances = [builder.instance for builder in builders]
+        builders[0].get_model().objects.bulk_create(
+            instances, batch_size=batch_size
+        )
+
+        # Preform post-db save actions.
+        for builder in builders:
+            builder.post()
+
+        return instances
@@ -0,0 +1,105 @@
+# Static vocabularies the fake data providers draw from. They only need
+# to look plausible; uniqueness comes from the providers combining the
+# entries with an incrementing counter.
+
+first_names = [
+    'Alice',
+    'Billy',
+    'Charlotte',
+    'Dmitri',
+    'Elena',
+    'Frank',
+    'Grace',
+    'Hamish',
+    'Ingrid',
+    'Jack',
+    'Katherine',
+    'Liam',
+    'Mary',
+    'Noah',
+    'Olivia',
+    'Patrick',
+]
+
+last_names = [
+    'Anderson',
+    'Betts',
+    'Chen',
+    'Davidson',
+    'Erikson',
+    'Fakeington',
+    'Garcia',
+    'Houlihan',
+    'Ivanov',
+    'Jackson',
+    'Kowalski',
+    'Lindqvist',
+    'Murphy',
+    'Nguyen',
+    'OBrien',
+    'Petrov',
+]
+
+countries = [
+    'Argentinian',
+    'Australian',
+    'Brazilian',
+    'Canadian',
+    'Danish',
+    'Egyptian',
+    'French',
+    'German',
+    'Hungarian',
+    'Indian',
+    'Japanese',
+    'Kenyan',
+    'Mexican',
+    'Norwegian',
+    'Portuguese',
+    'Swedish',
+]
+
+adjectives = [
+    'Applied',
+    'Computational',
+    'Contemporary',
+    'Experimental',
+    'International',
+    'Modern',
+    'Practical',
+    'Quarterly',
+    'Theoretical',
+    'Unlikely',
+]
+
+fields = [
+    'Agriculture',
+    'Astronomy',
+    'Biology',
+    'Chemistry',
+    'Economics',
+    'Geology',
+    'Linguistics',
+    'Mathematics',
+    'Medicine',
+    'Physics',
+]
+
+words = [
+    'argon',
+    'bramble',
+    'cactus',
+    'dune',
+    'ember',
+    'fjord',
+    'glacier',
+    'harbour',
+    'isthmus',
+    'juniper',
+    'krill',
+    'lagoon',
+    'meadow',
+    'nimbus',
+    'orchid',
+    'pumice',
+]
@@ -0,0 +1,66 @@
+def _build_fake():
+    # Deferred so importing this module costs nothing; faker and the
+    # provider registrations are only paid for when `fake` is first
+    # touched (PEP 562 module __getattr__ below).
+    from faker import Faker
+
+    from django_test_model_builder.providers import (
+        AffiliationNameProvider,
+        ArxivProvider,
+        CountryProvider,
+        DOIProvider,
+        EmailProvider,
+        GibberishProvider,
+        IDProvider,
+        ISSNProvider,
+        InstitutionNameProvider,
+        JournalNameProvider,
+        ManuscriptIDProvider,
+        NameProvider,
+        NumberProvider,
+        ORCIDProvider,
+        PMIDProvider,
+        PublicationTitleProvider,
+        PublisherNameProvider,
+        ResearcherIDProvider,
+        TruidProvider,
+        UTProvider,
+    )
+
+    fake = Faker()
+    for provider in (
+        AffiliationNameProvider,
+        ArxivProvider,
+        CountryProvider,
+        DOIProvider,
+        EmailProvider,
+        GibberishProvider,
+        IDProvider,
+        ISSNProvider,
+        InstitutionNameProvider,
+        JournalNameProvider,
+        ManuscriptIDProvider,
+        NameProvider,
+        NumberProvider,
+        ORCIDProvider,
+        PMIDProvider,
+        PublicationTitleProvider,
+        PublisherNameProvider,
+        ResearcherIDProvider,
+        TruidProvider,
+        UTProvider,
+    ):
+        fake.add_provider(provider)
+    return fake
+
+
+def __getattr__(name):
+    # Shared Faker instance registered with every provider, built on
+    # first access. Providers keep counter state, so everything should
+    # generate through this instance to preserve the uniqueness
+    # guarantees.
+    if name == 'fake':
+        value = globals()['fake'] = _build_fake()
+        return value
+
+    raise AttributeError(name)
@@ -0,0 +1,430 @@
+import os
+import random
+import string
+from itertools import count
+
+from faker.providers import BaseProvider
+
+from django_test_model_builder.data import (
+    adjectives,
+    countries,
+    fields,
+    first_names,
+    last_names,
+    words,
+)
+
+_UPPERS = string.ascii_uppercase
+
+# Opt-in trade of memory for speed: pre-render every combination a
+# product provider can emit when it is constructed, so calls never
+# format at all. Off by default since the lazy memo usually suffices.
+_PRECOMPUTE = (
+    os.environ.get('DJANGO_TEST_MODEL_BUILDER_PRECOMPUTE') == '1'
+)
+
+# Lowercased once at import; the email vocabulary is static, so calling
+# .lower() per generated address was repeated work.
+_adjectives_lower = tuple(adjective.lower() for adjective in adjectives)
+_last_names_lower = tuple(last_name.lower() for last_name in last_names)
+
+# The ISO 7064 11-2 fold ((total + digit) * 2 per digit) distributes
+# into a fixed power-of-two weight per digit position, so the check
+# digit is a weighted sum with no per-character int() casts.
+_ORCID_WEIGHTS = tuple(2 ** k for k in range(15, 0, -1))
+
+
+def _orcid_check_digit(value):
+    """
+    ISO 7064 11-2 check digit for a 15 digit orcid base, computed with
+    arithmetic digit extraction. Kept as a module-level function so a
+    compiled implementation could be swapped in without touching the
+    provider.
+    """
+    digit_values = []
+    for _ in range(15):
+        value, digit = divmod(value, 10)
+        digit_values.append(digit)
+    digit_values.reverse()
+    total = sum(
+        weight * digit
+        for weight, digit in zip(_ORCID_WEIGHTS, digit_values)
+    )
+    remainder = (12 - (total % 11)) % 11
+    return 'X' if remainder == 10 else str(remainder)
+
+
+_ISSN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2)
+
+
+def _issn_check_digit(base):
+    """
+    Mod 11 check digit over a 7 character issn base string. Module-level
+    for the same swap-in reason as _orcid_check_digit. Digits are read
+    with ord() - 48, which is considerably cheaper than int(char).
+    """
+    total = sum(
+        weight * (ord(char) - 48)
+        for weight, char in zip(_ISSN_WEIGHTS, base)
+    )
+    remainder = (11 - (total % 11)) % 11
+    return 'X' if remainder == 10 else str(remainder)
+
+
+def InfiniteIncrementer(start=0, step=1):
+    """
+    Endless integer source used by providers that derive unique tokens
+    from a counter. Backed by itertools.count so the increment happens
+    in C; the first value yielded is start + step, as the original
+    pure-Python incrementer behaved.
+    """
+    return count(start + step, step)
+
+
+# Counters behind the module-level fast-path functions below, shared
+# with the matching Faker providers so both entry points draw from one
+# sequence and uniqueness holds across them.
+_id_counter = InfiniteIncrementer()
+_number_counter = InfiniteIncrementer()
+_manuscript_id_counter = InfiniteIncrementer()
+
+
+def id():
+    """
+    Module-level counterpart of fake.id() that skips Faker's provider
+    proxy; next() on an itertools.count is the whole call.
+    """
+    return next(_id_counter)
+
+
+def number():
+    return next(_number_counter)
+
+
+def manuscript_id():
+    return f'MS-{next(_manuscript_id_counter)}'
+
+
+class GeneratorProvider(BaseProvider):
+    """
+    Base class for providers that pull tokens from a generator defined by
+    the subclass, restarting it transparently if it ever runs dry.
+    """
+
+    # BaseProvider itself is unslotted, so instances keep a __dict__ and
+    # the per-instance next() rebind in __init__ still has somewhere to
+    # land; the slot covers the hot token_generator lookup.
+    __slots__ = ('token_generator',)
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.token_generator = self.get_generator()
+        # count objects never raise StopIteration, so the guarded next()
+        # below is pure overhead for them; bind their C-implemented
+        # __next__ directly.
+        if isinstance(self.token_generator, count):
+            self.next = self.token_generator.__next__
+
+    def get_generator(self):
+        raise NotImplementedError(
+            'Generator method must be defined to provide tokens.'
+        )
+
+    def next(self):
+        try:
+            return next(self.token_generator)
+        except StopIteration:
+            self.token_generator = self.get_generator()
+            return next(self.token_generator)
+
+
+class ProductProvider(BaseProvider):
+    """
+    Base class for providers that combine static word lists. Instead of
+    materializing a tuple per combination through itertools.product, an
+    incrementing counter is decomposed with divmod into direct indexes
+    into the lists, wrapping modulo the product size on exhaustion so
+    there is no generator to restart.
+
+    Tokens are pure functions of the wrapped counter, so once the
+    counter laps the product every combination repeats; formatted output
+    is memoized per index and later cycles are a list lookup.
+    """
+
+    __slots__ = ('sizes', 'total', 'counter', 'cache')
+
+    lists = ()
+
+    # Products larger than this skip memoization rather than holding
+    # every formatted combination in memory.
+    CACHE_LIMIT = 4096
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.sizes = tuple(len(word_list) for word_list in self.lists)
+        total = 1
+        for size in self.sizes:
+            total *= size
+        self.total = total
+        self.counter = InfiniteIncrementer(start=-1)
+        if total <= self.CACHE_LIMIT:
+            if _PRECOMPUTE:
+                self.cache = [
+                    self.format_token(*self._indexes_for(i))
+                    for i in range(total)
+                ]
+            else:
+                self.cache = [None] * total
+        else:
+            self.cache = None
+
+    def format_token(self, *indexes):
+        raise NotImplementedError(
+            'Format method must be defined to build tokens.'
+        )
+
+    def _indexes_for(self, i):
+        indexes = []
+        for size in reversed(self.sizes):
+            i, index = divmod(i, size)
+            indexes.append(index)
+        indexes.reverse()
+        return indexes
+
+    def next_token(self):
+        i = next(self.counter) % self.total
+        cache = self.cache
+        if cache is not None:
+            token = cache[i]
+            if token is not None:
+                return token
+
+        token = self.format_token(*self._indexes_for(i))
+        if cache is not None:
+            cache[i] = token
+        return token
+
+
+class IDProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return _id_counter
+
+    def id(self):
+        return self.next()
+
+
+class NumberProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return _number_counter
+
+    def number(self):
+        return self.next()
+
+
+class DOIProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def doi(self):
+        return f'10.1234/PUBLONS.TEST.{self.next()}'
+
+
+class PMIDProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def pmid(self):
+        i = self.next()
+        return f'{i}.{i}'
+
+
+class ArxivProvider(GeneratorProvider):
+    prefix = 'arXiv'
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def arxiv(self):
+        return f'{self.prefix}:{self.next()}'
+
+
+class UTProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def ut(self):
+        return f'WOS:{self.next():015}'
+
+
+class ManuscriptIDProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return _manuscript_id_counter
+
+    def manuscript_id(self):
+        return f'MS-{self.next()}'
+
+
+class PublisherNameProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def publisher_name(self):
+        return f'Publisher {self.next()}'
+
+
+class PublicationTitleProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def publication_title(self):
+        return f'Publication {self.next()}'
+
+
+class InstitutionNameProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def institution_name(self):
+        return f'Institution {self.next()}'
+
+
+class AffiliationNameProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def affiliation_name(self):
+        return f'Affiliation {self.next()}'
+
+
+class NameProvider(ProductProvider):
+    lists = (first_names, last_names)
+
+    def format_token(self, a, b):
+        return f'{first_names[a]} {last_names[b]}'
+
+    def name(self):
+        return self.next_token()
+
+
+class JournalNameProvider(ProductProvider):
+    lists = (countries, adjectives, fields)
+
+    def format_token(self, a, b, c):
+        return f'The {countries[a]} Journal of {adjectives[b]} {fields[c]}'
+
+    def journal_name(self):
+        return self.next_token()
+
+
+class EmailProvider(ProductProvider):
+    lists = (adjectives, last_names)
+
+    def format_token(self, a, b):
+        return f'{_adjectives_lower[a]}.{_last_names_lower[b]}@test.com'
+
+    def email(self):
+        return self.next_token()
+
+
+class GibberishProvider(ProductProvider):
+    lists = (words, words, words)
+
+    def format_token(self, a, b, c):
+        return f'{words[a]} {words[b]} {words[c]}'
+
+    def gibberish(self):
+        return self.next_token()
+
+
+class CountryProvider(ProductProvider):
+    lists = (countries,)
+
+    def format_token(self, a):
+        return countries[a][:50]
+
+    def country_name(self):
+        return self.next_token()
+
+
+class ORCIDProvider(GeneratorProvider):
+    # 15 digit base so every orcid is the same width before the ISO 7064
+    # check digit is appended.
+    START = 10 ** 14
+
+    def get_generator(self):
+        return InfiniteIncrementer(start=self.START)
+
+    def orcid(self):
+        value = self.next()
+        digits = f'{value}{_orcid_check_digit(value)}'
+        return f'{digits[:4]}-{digits[4:8]}-{digits[8:12]}-{digits[12:]}'
+
+
+class ISSNProvider(GeneratorProvider):
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def issn(self):
+        base = f'{self.next():07d}'
+        return f'{base[:4]}-{base[4:]}{_issn_check_digit(base)}'
+
+
+class ResearcherIDProvider(GeneratorProvider):
+
+    __slots__ = ('_rng',)
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        # A private Random instance skips the module-level lock, and
+        # scaling random() avoids randint's rejection-sampling loop for
+        # these tiny ranges.
+        self._rng = random.Random()
+
+    def get_generator(self):
+        return InfiniteIncrementer()
+
+    def researcher_id(self):
+        rng = self._rng.random
+        letter = _UPPERS[int(rng() * 26)]
+        year = 2008 + int(rng() * 11)
+        return f'{letter}-{self.next()}-{year}'
+
+
+class TruidProvider(BaseProvider):
+
+    __slots__ = ('_buffer', '_offset')
+
+    # Number of 16-byte uuids drawn per urandom refill; amortizes the
+    # entropy syscall across a batch of truids.
+    BUFFER_UUIDS = 384
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self._buffer = b''
+        self._offset = 0
+
+    def truid(self):
+        offset = self._offset
+        if offset >= len(self._buffer):
+            self._buffer = os.urandom(16 * self.BUFFER_UUIDS)
+            offset = 0
+        raw = bytearray(self._buffer[offset:offset + 16])
+        self._offset = offset + 16
+
+        # Stamp the RFC 4122 version and variant bits for a v4 uuid and
+        # format from hex directly, skipping UUID object construction.
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        h = raw.hex()
+        return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
@@ -19,6 +19,7 @@ setup(
     ),
     install_requires=[
         'Django',
+        'Faker',
     ],
     url='https://github.com/publons/django-test-model-builder',
     author='Matthew Betts, Aidan Houlihan',
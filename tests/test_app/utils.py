@@ -1,4 +1,6 @@
 from django_test_model_builder import ModelBuilder
+from django_test_model_builder.fake import fake
+from django_test_model_builder.providers import number
 
 from tests.test_app.models import Author, User
 
@@ -9,8 +11,10 @@ class AuthorBuilder(ModelBuilder):
     def get_default_fields(self):
         return {
             'user': UserBuilder().build,
-            'publishing_name': 'Jack Jackson',
-            'age': 23,
+            # Callable references, not calls: fake.name() here would
+            # bake one generated name into the cached defaults template.
+            'publishing_name': fake.name,
+            'age': number,
         }
 
 
@@ -19,5 +23,5 @@ class UserBuilder(ModelBuilder):
 
     def get_default_fields(self):
         return {
-            'email': 'fakeFakeson@gmail.com',
+            'email': fake.email,
         }
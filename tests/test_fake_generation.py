@@ -0,0 +1,72 @@
+from django.test import SimpleTestCase
+
+from django_test_model_builder.data import (
+    countries, first_names, last_names,
+)
+from django_test_model_builder.fake import fake
+from django_test_model_builder.providers import number
+
+
+class TestFakeDataGeneration(SimpleTestCase):
+
+    def test_ids_increment_per_call(self):
+        first = fake.id()
+        second = fake.id()
+        self.assertEqual(first + 1, second)
+
+    def test_module_level_number_shares_the_provider_counter(self):
+        first = number()
+        second = fake.number()
+        self.assertEqual(first + 1, second)
+        self.assertEqual(second + 1, number())
+
+    def test_name_combines_the_word_lists(self):
+        first_name, last_name = fake.name().split(' ')
+        self.assertIn(first_name, first_names)
+        self.assertIn(last_name, last_names)
+
+    def test_names_do_not_repeat_within_a_full_cycle(self):
+        total = len(first_names) * len(last_names)
+        names = {fake.name() for _ in range(total)}
+        self.assertEqual(total, len(names))
+
+    def test_email_is_a_lowercase_test_address(self):
+        email = fake.email()
+        self.assertTrue(email.endswith('@test.com'))
+        self.assertEqual(email, email.lower())
+
+    def test_doi_uses_the_test_prefix(self):
+        self.assertTrue(fake.doi().startswith('10.1234/PUBLONS.TEST.'))
+
+    def test_orcid_check_digit_is_valid(self):
+        digits = fake.orcid().replace('-', '')
+        self.assertEqual(16, len(digits))
+
+        total = 0
+        for char in digits[:-1]:
+            total = (total + int(char)) * 2
+        remainder = (12 - (total % 11)) % 11
+        expected = 'X' if remainder == 10 else str(remainder)
+        self.assertEqual(expected, digits[-1])
+
+    def test_issn_check_digit_is_valid(self):
+        issn = fake.issn()
+        digits = issn.replace('-', '')
+        self.assertEqual(8, len(digits))
+
+        total = sum(
+            (8 - i) * int(char) for i, char in enumerate(digits[:-1])
+        )
+        remainder = (11 - (total % 11)) % 11
+        expected = 'X' if remainder == 10 else str(remainder)
+        self.assertEqual(expected, digits[-1])
+
+    def test_country_name_is_drawn_from_the_country_list(self):
+        country_name = fake.country_name()
+        self.assertIn(country_name, countries)
+        self.assertLessEqual(len(country_name), 50)
+
+    def test_truid_is_a_uuid_string(self):
+        truid = fake.truid()
+        self.assertEqual(36, len(truid))
+        self.assertEqual(4, truid.count('-'))
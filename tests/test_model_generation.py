@@ -1,5 +1,7 @@
 from django.test import TestCase
 
+from django_test_model_builder import CannotSetFieldOnModelException
+
 from tests.test_app.utils import AuthorBuilder, UserBuilder
 from tests.test_app.models import Author, User
 
@@ -35,6 +37,25 @@ class TestAuthorModelCreation(TestCase):
             number_of_models_to_generate, Author.objects.all().count()
         )
 
+    def test_bulk_build_creates_all_models(self):
+        number_of_models_to_generate = 10
+
+        authors = AuthorBuilder.bulk_build([
+            AuthorBuilder().with_publishing_name(self.publishing_name)
+            for _ in range(number_of_models_to_generate)
+        ])
+
+        self.assertEqual(number_of_models_to_generate, len(authors))
+        self.assertEqual(
+            number_of_models_to_generate, Author.objects.count()
+        )
+        self.assertEqual(
+            number_of_models_to_generate,
+            Author.objects.filter(
+                publishing_name=self.publishing_name
+            ).count()
+        )
+
     def test_dynamic_field_setter_changes(self):
         class CustomAuthorBuilder(AuthorBuilder):
             dynamic_field_setter_prefix = 'set_'
@@ -59,6 +80,14 @@ class TestAuthorModelCreation(TestCase):
         self.assertEqual(self.publishing_name, author.publishing_name)
         self.assertEqual(1, Author.objects.count())
 
+    def test_build_merges_defaults_and_overrides_exactly(self):
+        builder = AuthorBuilder().with_age(50)
+        author = builder.build(save_to_db=False)
+        self.assertEqual(50, author.age)
+        self.assertEqual(
+            {'user', 'publishing_name', 'age'}, set(builder.model_fields)
+        )
+
     def test_builder_can_chain_fields(self):
         new_age = 3
         author = (
@@ -71,6 +100,40 @@ class TestAuthorModelCreation(TestCase):
         self.assertEqual(new_age, author.age)
         self.assertEqual(1, Author.objects.count())
 
+    def test_overridden_default_callables_are_not_invoked(self):
+        calls = []
+
+        class CustomAuthorBuilder(AuthorBuilder):
+            def get_default_fields(self):
+                defaults = super().get_default_fields()
+
+                def expensive_name():
+                    calls.append(1)
+                    return 'Generated Name'
+
+                defaults['publishing_name'] = expensive_name
+                return defaults
+
+        author = (
+            CustomAuthorBuilder()
+            .with_publishing_name(self.publishing_name)
+            .build()
+        )
+        self.assertEqual(self.publishing_name, author.publishing_name)
+        self.assertEqual([], calls)
+
+    def test_setting_an_unknown_field_raises(self):
+        with self.assertRaises(CannotSetFieldOnModelException):
+            AuthorBuilder().with_favourite_colour('red')
+
+    def test_builders_do_not_share_data_between_instances(self):
+        builder = AuthorBuilder().with_publishing_name(self.publishing_name)
+        other = AuthorBuilder()
+        self.assertEqual(
+            {'publishing_name': self.publishing_name}, builder.data
+        )
+        self.assertEqual({}, other.data)
+
     def test_builder_can_override_user(self):
         new_user = UserBuilder().build()
         author = (
@@ -81,6 +144,16 @@ class TestAuthorModelCreation(TestCase):
         self.assertEqual(new_user, author.user)
         self.assertEqual(1, User.objects.count())
 
+    def test_builder_can_override_user_by_attname(self):
+        new_user = UserBuilder().build()
+        author = (
+            AuthorBuilder()
+            .with_user_id(new_user.pk)
+            .build()
+        )
+        self.assertEqual(new_user, author.user)
+        self.assertEqual(1, User.objects.count())
+
     def test_builder_can_save_model_in_memory(self):
         author = (
             AuthorBuilder()